@@ -140,6 +140,11 @@ def _resample_neighbor(orig, dimensions, offset, m1):
                        (base + offset) - offset)
     cd = np.array(dimlist).round().astype(int)
 
+    # Rounding can place the last sample one element past the end of the
+    # input, so clip the indices to the valid range along each axis.
+    for i in range(orig.ndim):
+        cd[i] = np.clip(cd[i], 0, orig.shape[i] - 1)
+
     return orig[tuple(list(cd))]
 
 
@@ -219,23 +224,29 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
     Returns
     -------
     A four dimensional `numpy.ndarray` that can be used to easily create
-    two-dimensional arrays of superpixels of the input image.
+    two-dimensional arrays of superpixels of the input image. This is a view
+    of ``img``, so no data is copied.
 
     References
     ----------
     https://mail.scipy.org/pipermail/numpy-discussion/2010-July/051760.html
     """
     # make sure the input dimensions are integers
-    dimensions = [int(dim) for dim in dimensions]
+    dy, dx = [int(dim) for dim in dimensions]
+
+    # New dimensions of the final image. These are computed from the offsets
+    # as given, which may be fractional, before truncating them for slicing.
+    ny = int((img.shape[0] - offset[0]) // dy)
+    nx = int((img.shape[1] - offset[1]) // dx)
 
-    # New dimensions of the final image
-    na = int(np.floor((img.shape[0] - offset[0]) / dimensions[0]))
-    nb = int(np.floor((img.shape[1] - offset[1]) / dimensions[1]))
+    # make sure the offsets used for slicing are integers
+    oy, ox = [int(off) for off in offset]
 
     # Reshape up to a higher dimensional array which is useful for higher
-    # level operations
-    return (img[int(offset[0]):int(offset[0] + na * dimensions[0]),
-                int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(na, dimensions[0], nb, dimensions[1])
+    # level operations. Slicing followed by splitting each axis in two is
+    # always expressible with strides, so this returns a view of ``img``
+    # rather than a copy.
+    return img[oy:oy + ny * dy, ox:ox + nx * dx].reshape(ny, dy, nx, dx)
 
 
 class UnrecognizedInterpolationMethod(ValueError):
@@ -15,6 +15,11 @@ from sunpy.util import replacement_filename
 __all__ = ['slugify', 'get_content_disposition', 'get_filename', 'get_system_filename',
            'download_file', 'download_fileobj']
 
+# Size of the chunks read from the network when downloading a file.
+# Python 3.8+ provides shutil.COPY_BUFSIZE (64 KiB on POSIX, 1 MiB on
+# Windows); Python 3.7 has no such constant and copies in 16 KiB chunks.
+_COPY_BUFSIZE = getattr(shutil, 'COPY_BUFSIZE', 64 * 1024)
+
 # Characters not allowed in slugified version.
 _punct_re = re.compile(r'[:\t !"#$%&\'()*\-/<=>?@\[\\\]^_`{|},.]+')
 
@@ -76,11 +81,26 @@ def get_content_disposition(content_disposition):
     return name
 
 
+def _safe_basename(name):
+    """
+    Reduce ``name`` to a bare filename so that it cannot point outside the
+    download directory.
+
+    Both ``/`` and ``\\`` are treated as path separators, and ``.`` or ``..``
+    give an empty string.
+    """
+    name = os.path.basename(name.replace('\\', '/'))
+    if name in ('.', '..'):
+        return ''
+    return name
+
+
 def get_filename(sock, url):
     """
     Get filename from given `~urllib.request.urlopen` object and URL.
 
     First, tries the "Content-Disposition", if unavailable, extracts name from the URL.
+    Any directory components in either name are discarded.
 
     Parameters
     ----------
@@ -101,10 +121,12 @@ def get_filename(sock, url):
             name = get_content_disposition(cd)
         except IndexError:
             pass
+    if name:
+        name = _safe_basename(name)
 
     if not name:
         parsed = urlparse(url)
-        name = parsed.path.rstrip('/').rsplit('/', 1)[-1]
+        name = _safe_basename(parsed.path.rstrip('/'))
     return str(name)
 
 
@@ -165,10 +187,28 @@ def download_fileobj(opn, directory, url='', default="file", overwrite=False):
     if overwrite and os.path.exists(path):
         path = replacement_filename(path)
     with open(path, 'wb') as fd:
-        shutil.copyfileobj(opn, fd)
+        _copy_stream(opn, fd)
     return path
 
 
+def _copy_stream(fsrc, fdst, length=_COPY_BUFSIZE):
+    """
+    Copy ``fsrc`` to ``fdst`` in chunks of ``length`` bytes.
+
+    If ``fsrc`` supports ``readinto`` a single buffer is reused for every
+    chunk, otherwise this falls back to `shutil.copyfileobj`.
+    """
+    if not hasattr(fsrc, 'readinto'):
+        shutil.copyfileobj(fsrc, fdst, length)
+        return
+    with memoryview(bytearray(length)) as mv:
+        while True:
+            n = fsrc.readinto(mv)
+            if not n:
+                break
+            fdst.write(mv[:n])
+
+
 def download_file(url, directory, default="file", overwrite=False):
     """
     Download a file from a url into a directory.
@@ -1,4 +1,5 @@
 # Author: Florian Mayer <florian.mayer@bitsrc.org>
+import io
 
 import sunpy.util.net
 
@@ -17,6 +18,66 @@ def test_content_disposition_unicode():
     assert isinstance(ret, str)
 
 
+class _MockSock:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def test_get_filename_content_disposition():
+    sock = _MockSock({'Content-Disposition': 'attachment; filename="aia.fits"'})
+    assert sunpy.util.net.get_filename(sock, "http://example.com/data?id=1") == "aia.fits"
+
+
+def test_get_filename_content_disposition_path():
+    sock = _MockSock({'Content-Disposition': 'attachment; filename="../../aia.fits"'})
+    assert sunpy.util.net.get_filename(sock, "http://example.com/") == "aia.fits"
+    sock = _MockSock({'Content-Disposition': 'attachment; filename="..\\..\\aia.fits"'})
+    assert sunpy.util.net.get_filename(sock, "http://example.com/") == "aia.fits"
+    sock = _MockSock({'Content-Disposition': 'attachment; filename=".."'})
+    assert sunpy.util.net.get_filename(sock, "http://example.com/aia.fits") == "aia.fits"
+    sock = _MockSock({'Content-Disposition': 'attachment; filename="."'})
+    assert sunpy.util.net.get_filename(sock, "http://example.com/aia.fits") == "aia.fits"
+    sock = _MockSock({'Content-Disposition': 'attachment; filename=".."'})
+    assert sunpy.util.net.get_system_filename(sock, "http://example.com/a/..") == b"file"
+
+
+def test_get_filename_url():
+    sock = _MockSock({})
+    assert sunpy.util.net.get_filename(sock, "http://example.com/data/aia.fits") == "aia.fits"
+
+
+class _MockResponse(io.BytesIO):
+    def __init__(self, data, headers):
+        super().__init__(data)
+        self.headers = headers
+
+
+def test_download_fileobj(tmpdir):
+    data = bytes(range(256)) * 1024
+    opn = _MockResponse(data, {})
+    path = sunpy.util.net.download_fileobj(opn, str(tmpdir), "http://example.com/aia.fits")
+    assert path == str(tmpdir.join("aia.fits"))
+    assert tmpdir.join("aia.fits").read_binary() == data
+
+
+class _MockReadOnlyResponse:
+    def __init__(self, data, headers):
+        self._buffer = io.BytesIO(data)
+        self.headers = headers
+
+    def read(self, size=-1):
+        return self._buffer.read(size)
+
+
+def test_download_fileobj_no_readinto(tmpdir):
+    data = bytes(range(256)) * 1024
+    opn = _MockReadOnlyResponse(data, {})
+    assert not hasattr(opn, 'readinto')
+    path = sunpy.util.net.download_fileobj(opn, str(tmpdir), "http://example.com/aia.fits")
+    assert path == str(tmpdir.join("aia.fits"))
+    assert tmpdir.join("aia.fits").read_binary() == data
+
+
 def test_slugify():
     assert sunpy.util.net.slugify("äb c", "b_c")
     assert sunpy.util.net.slugify("file.greg.fits") == "file_greg.fits"